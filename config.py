@@ -1,27 +1,41 @@
 import os
 from typing import List, Tuple, Optional
-from dotenv import load_dotenv
+from dotenv import dotenv_values
+
+# Parse the .env file once; real environment variables still take precedence
+_ENV = dotenv_values()
+
+
+def _getenv(key: str, default: str) -> str:
+    """Read a setting from the environment, then .env, then the default"""
+    value = os.environ.get(key)
+    if value is None:
+        value = _ENV.get(key)
+    return default if value is None else value
 
-# Load environment variables from .env file
-load_dotenv()
 
 # Google Sheets Configuration
-SPREADSHEET_ID: str = os.getenv("SPREADSHEET_ID", "")
-SHEET_NAMES: List[str] = os.getenv("SHEET_NAMES", "").split(",")
+SPREADSHEET_ID: str = _getenv("SPREADSHEET_ID", "")
+SHEET_NAMES: List[str] = [
+    name for name in _getenv("SHEET_NAMES", "").split(",") if name
+]
 
 # Google Auth Files
-TOKEN_FILE: str = os.getenv("TOKEN_FILE", "token.pickle")
-CREDENTIALS_FILE: str = os.getenv("CREDENTIALS_FILE", "credentials.json")
+TOKEN_FILE: str = _getenv("TOKEN_FILE", "token.pickle")
+CREDENTIALS_FILE: str = _getenv("CREDENTIALS_FILE", "credentials.json")
 SCOPES: List[str] = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# Cached sheet name -> sheet ID map (delete the file to refresh it)
+SHEET_IDS_FILE: str = _getenv("SHEET_IDS_FILE", ".sheet_ids.json")
+
 # Performance Thresholds
-GLOBAL_THRESHOLD: int = int(os.getenv("GLOBAL_THRESHOLD", "8"))
+GLOBAL_THRESHOLD: int = int(_getenv("GLOBAL_THRESHOLD", "8"))
 
 # Scraper Settings
-RUN_SCRAPER: bool = os.getenv("RUN_SCRAPER", "True").lower() == "true"
+RUN_SCRAPER: bool = _getenv("RUN_SCRAPER", "True").lower() == "true"
 
 # Output Files
-COMBINED_CSV: str = os.getenv("COMBINED_CSV", "combined_results.csv")
+COMBINED_CSV: str = _getenv("COMBINED_CSV", "combined_results.csv")
 
 # Contest Configuration
 # Format: (contest_name, contest_url, individual_threshold)
@@ -40,14 +54,35 @@ CONTESTS: List[Tuple[str, str, Optional[int]]] = [
 ]
 
 # Scraper Delays (in seconds)
+# The page delay starts at MIN_PAGE_DELAY, shrinks while pages load cleanly and
+# doubles (up to MAX_PAGE_DELAY) whenever Cloudflare steps in
 MIN_PAGE_DELAY: float = 1.0
-MAX_PAGE_DELAY: float = 2.0
+MAX_PAGE_DELAY: float = 10.0
 MIN_CLICK_DELAY: float = 0.5
 MAX_CLICK_DELAY: float = 1.0
 CLOUDFLARE_WAIT: int = 5
 
 MAX_PAGES: int = 100
 
+# Rows on a full standings page; fewer means it was the last page
+STANDINGS_PAGE_SIZE: int = 50
+
+# Google Sheets API requests sent per batchUpdate call
+MAX_BATCH_REQUESTS: int = 500
+
+# Resources the headless browser never needs to download
+BLOCKED_URL_PATTERNS: List[str] = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.css",
+    "*google-analytics*",
+]
+
 
 def validate_config() -> bool:
     """Validate that all required configuration is present"""
@@ -55,6 +90,10 @@ def validate_config() -> bool:
         print("❌ ERROR: SPREADSHEET_ID not set in .env file")
         return False
 
+    if not SHEET_NAMES:
+        print("❌ ERROR: SHEET_NAMES not set in .env file")
+        return False
+
     if not os.path.exists(CREDENTIALS_FILE):
         print(f"❌ ERROR: {CREDENTIALS_FILE} not found")
         return False
@@ -5,6 +5,7 @@ from typing import Dict, Tuple
 import config
 from scraper.codeforces import CodeforcesScraper
 from sheets.operations import clean_google_sheets
+from utils.csv_io import STANDINGS_DTYPES, read_csv, write_csv
 from utils.logger import logger
 
 
@@ -28,7 +29,7 @@ def load_existing_csvs() -> Dict[str, pd.DataFrame]:
             sys.exit(1)
 
         logger.info(f"📂 Loading existing CSV: {csv_file}")
-        df = pd.read_csv(csv_file)
+        df = read_csv(csv_file, STANDINGS_DTYPES)
         dfs[contest_name] = df
         logger.info(f"✅ Loaded {len(df)} participants\n")
 
@@ -49,41 +50,29 @@ def generate_combined_csv(dfs: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     logger.info("STEP 4: GENERATING COMBINED RESULTS")
     logger.info("=" * 60)
 
-    # Collect all unique handles
-    all_handles = set()
-    for df in dfs.values():
-        all_handles.update(df["Handle"].tolist())
-
-    combined_data = []
-
-    for handle in sorted(all_handles):
-        row = {"Handle": handle}
-        total_all_contests = 0
-
-        for contest_config in config.CONTESTS:
-            contest_name = contest_config[0]
-            df = dfs[contest_name]
-            match = df[df["Handle"] == handle]
-
-            if not match.empty:
-                solved = match.iloc[0]["Total_Solved"]
-            else:
-                solved = 0
-
-            row[f"{contest_name}_Solved"] = solved
-            total_all_contests += solved
-
-        row["Total_All_Contests"] = total_all_contests
-        combined_data.append(row)
-
-    # Create DataFrame and sort
-    combined_df = pd.DataFrame(combined_data)
-    combined_df = combined_df.sort_values(
-        "Total_All_Contests", ascending=False
-    ).reset_index(drop=True)
+    # Align every contest on Handle and let pandas do the outer join.
+    # Duplicate handles keep their first row; concat can't align repeated labels.
+    solved_columns = [
+        dfs[contest_name]
+        .drop_duplicates("Handle")
+        .set_index("Handle")["Total_Solved"]
+        .rename(f"{contest_name}_Solved")
+        for contest_name, _, _ in config.CONTESTS
+    ]
+
+    combined_df = pd.concat(solved_columns, axis=1).fillna(0).astype(int)
+    combined_df.index.name = "Handle"
+    combined_df["Total_All_Contests"] = combined_df.sum(axis=1)
+
+    # Sort by handle first so ties keep a stable alphabetical order
+    combined_df = (
+        combined_df.sort_index()
+        .sort_values("Total_All_Contests", ascending=False, kind="stable")
+        .reset_index()
+    )
 
     # Save to CSV
-    combined_df.to_csv(config.COMBINED_CSV, index=False, encoding="utf-8-sig")
+    write_csv(combined_df, config.COMBINED_CSV)
 
     logger.info(f"\n✅ Generated combined results CSV: {config.COMBINED_CSV}")
     logger.info(f"✅ Total unique participants: {len(combined_df)}\n")
@@ -1,12 +1,17 @@
+import os
 import time
-import random
+import lxml.html
 import pandas as pd
-from typing import List, Dict, Set, Tuple, Optional
+import pyarrow as pa
+import pyarrow.compute as pc
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from scraper.driver import DriverManager
+from scraper.driver import DriverManager, prepare_chromedriver
+from utils.csv_io import write_table
 from utils.logger import logger
 import config
 
@@ -20,9 +25,13 @@ class CodeforcesScraperError(Exception):
 class CodeforcesScraper:
 
     def __init__(self):
-        self.participants: Dict[str, Set[str]] = {}
+        # Solved problems per handle as a bitmask, bit 0 = problem A
+        self.participants: Dict[str, int] = {}
+        self._delay: float = config.MIN_PAGE_DELAY
 
-    def extract_page_data(self, driver: DriverManager) -> List[Dict[str, any]]:
+    def extract_page_data(
+        self, driver: DriverManager
+    ) -> Tuple[List[Dict[str, any]], int]:
         """
         Extract participant data from current standings page
 
@@ -30,91 +39,110 @@ class CodeforcesScraper:
             driver: DriverManager instance
 
         Returns:
-            List of dictionaries containing handle and solved problems
+            Tuple of (list of dictionaries containing handle and solved problems
+            bitmask, number of standings rows on the page including skipped ones)
         """
         try:
             WebDriverWait(driver.driver, 20).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "table.standings"))
             )
-            time.sleep(0.5)
 
-            rows = driver.driver.find_elements(
-                By.CSS_SELECTOR, "table.standings tbody tr"
-            )
+            # Pull the rendered HTML once and parse it locally instead of
+            # round-tripping to the browser for every row and cell
+            doc = lxml.html.fromstring(driver.driver.page_source)
             data = []
+            row_count = 0
 
-            for row in rows:
+            for row in doc.cssselect("table.standings tbody tr"):
                 try:
-                    row_class = row.get_attribute("class") or ""
+                    row_class = row.get("class") or ""
                     if "header" in row_class:
                         continue
 
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    row_count += 1
+
+                    cells = row.findall("td")
                     if len(cells) < 5:
                         continue
 
-                    handle = cells[1].text.strip().replace("*", "").strip()
+                    handle = cells[1].text_content().strip().replace("*", "").strip()
                     if not handle:
                         continue
 
-                    solved = []
-                    for i in range(4, len(cells)):
-                        cell = cells[i]
-                        cell_class = cell.get_attribute("class") or ""
+                    mask = 0
+                    for i, cell in enumerate(cells[4:], start=4):
+                        cell_class = cell.get("class") or ""
 
-                        if "accepted" in cell_class.lower() or "+" in cell.text:
-                            problem_letter = chr(65 + i - 4)
-                            solved.append(problem_letter)
+                        if (
+                            "accepted" in cell_class.lower()
+                            or "+" in cell.text_content()
+                        ):
+                            mask |= 1 << (i - 4)
 
-                    data.append({"Handle": handle, "Solved": solved})
+                    data.append({"Handle": handle, "Mask": mask})
 
                 except Exception as e:
                     logger.debug(f"Error parsing row: {e}")
                     continue
 
-            return data
+            return data, row_count
 
         except Exception as e:
             logger.error(f"Failed to extract page data: {e}")
             raise CodeforcesScraperError(f"Data extraction failed: {e}")
 
-    def scrape_page(self, url: str, page_num: int) -> Optional[List[Dict[str, any]]]:
+    def scrape_page(
+        self, driver: DriverManager, url: str, page_num: int
+    ) -> Optional[Tuple[List[Dict[str, any]], int]]:
         """
         Scrape a single page of contest standings
 
         Args:
+            driver: DriverManager instance with a live browser session
             url: Contest standings URL
             page_num: Page number to scrape
 
         Returns:
-            List of participant data or None if failed
+            Tuple of (participant data, raw row count) or None if failed
         """
-        with DriverManager() as driver:
-            try:
-                page_url = url if page_num == 1 else f"{url}/page/{page_num}"
+        try:
+            page_url = url if page_num == 1 else f"{url}/page/{page_num}"
 
-                logger.info(f"[PAGE {page_num}] Loading...")
-                driver.driver.get(page_url)
+            if page_num > 1:
+                time.sleep(self._delay)
 
-                time.sleep(random.uniform(config.MIN_PAGE_DELAY, config.MAX_PAGE_DELAY))
+            logger.info(f"[PAGE {page_num}] Loading...")
+            driver.driver.get(page_url)
 
-                driver.wait_for_cloudflare()
+            challenged = driver.wait_for_cloudflare()
 
-                driver.click_unofficial_checkbox()
+            driver.click_unofficial_checkbox()
 
-                if driver.check_access_denied():
-                    raise CodeforcesScraperError("Access denied by Cloudflare")
+            if driver.check_access_denied():
+                self._back_off()
+                raise CodeforcesScraperError("Access denied by Cloudflare")
 
-                page_data = self.extract_page_data(driver)
-                logger.info(
-                    f"[PAGE {page_num}] Extracted {len(page_data)} participants"
-                )
+            if challenged:
+                self._back_off()
+            else:
+                self._speed_up()
+
+            page_data, row_count = self.extract_page_data(driver)
+            logger.info(f"[PAGE {page_num}] Extracted {len(page_data)} participants")
 
-                return page_data
+            return page_data, row_count
+
+        except Exception as e:
+            logger.error(f"[PAGE {page_num}] Error: {e}")
+            return None
 
-            except Exception as e:
-                logger.error(f"[PAGE {page_num}] Error: {e}")
-                return None
+    def _back_off(self) -> None:
+        """Double the page delay after Cloudflare pushed back"""
+        self._delay = min(config.MAX_PAGE_DELAY, self._delay * 2)
+
+    def _speed_up(self) -> None:
+        """Shrink the page delay after a clean page load"""
+        self._delay = max(config.MIN_PAGE_DELAY * 0.5, self._delay * 0.8)
 
     def scrape_contest(
         self, contest_name: str, contest_url: str
@@ -136,60 +164,80 @@ class CodeforcesScraper:
         self.participants = {}
         page = 1
 
-        while page <= config.MAX_PAGES:
-            page_data = self.scrape_page(contest_url, page)
+        # One browser session for every page keeps Cloudflare cookies warm
+        with DriverManager() as driver:
+            while page <= config.MAX_PAGES:
+                result = self.scrape_page(driver, contest_url, page)
+
+                if result is None:
+                    break
+
+                page_data, row_count = result
+                if not page_data:
+                    break
 
-            if not page_data:
-                break
+                # Update participants dictionary and track if any new data was found
+                new_count = 0
+                any_new_data = False
 
-            # Update participants dictionary and track if any new data was found
-            new_count = 0
-            any_new_data = False
+                for entry in page_data:
+                    handle = entry["Handle"]
 
-            for entry in page_data:
-                handle = entry["Handle"]
-                solved = set(entry["Solved"])
+                    if handle not in self.participants:
+                        self.participants[handle] = entry["Mask"]
+                        new_count += 1
+                        any_new_data = True
+                        continue
 
-                if handle in self.participants:
-                    old_solved = self.participants[handle]
-                    new_solved = old_solved.union(solved)
+                    old_mask = self.participants[handle]
+                    new_mask = old_mask | entry["Mask"]
 
                     # Check if there are any new problems solved
-                    if len(new_solved) > len(old_solved):
-                        self.participants[handle] = new_solved
+                    if new_mask != old_mask:
+                        self.participants[handle] = new_mask
                         any_new_data = True
-                    else:
-                        self.participants[handle] = new_solved
-                else:
-                    self.participants[handle] = solved
-                    new_count += 1
-                    any_new_data = True
-
-            logger.info(f"[INFO] New: {new_count} | Total: {len(self.participants)}")
-
-            # Stop if no new data (no new handles AND no additional problems solved)
-            if not any_new_data:
-                logger.info("[INFO] No new data found. Stopping scrape.")
-                break
-
-            time.sleep(random.uniform(config.MIN_PAGE_DELAY, config.MAX_PAGE_DELAY))
-            page += 1
-
-        df = pd.DataFrame(
-            [
-                {
-                    "Handle": handle,
-                    "Solved_Problems": ",".join(sorted(problems)),
-                    "Total_Solved": len(problems),
-                }
-                for handle, problems in self.participants.items()
-            ]
-        )
 
-        df = df.sort_values("Total_Solved", ascending=False).reset_index(drop=True)
+                logger.info(
+                    f"[INFO] New: {new_count} | Total: {len(self.participants)}"
+                )
+
+                # Stop if no new data (no new handles AND no additional problems solved)
+                if not any_new_data:
+                    logger.info("[INFO] No new data found. Stopping scrape.")
+                    break
+
+                # A short page is the last one, no need to load the next. Count
+                # every row, not just the parsed ones, so skipped rows don't
+                # make a full page look short.
+                if row_count < config.STANDINGS_PAGE_SIZE:
+                    logger.info("[INFO] Reached last page. Stopping scrape.")
+                    break
+
+                page += 1
+
+        # Build the result column-wise in Arrow and convert to pandas only once
+        handles = list(self.participants)
+        masks = list(self.participants.values())
+
+        table = pa.table(
+            {
+                "Handle": pa.array(handles, type=pa.string()),
+                "Solved_Problems": pa.array(
+                    [_decode_mask(mask) for mask in masks], type=pa.string()
+                ),
+                "Total_Solved": pa.array(
+                    [mask.bit_count() for mask in masks], type=pa.int32()
+                ),
+            }
+        )
+        table = table.take(
+            pc.sort_indices(table, sort_keys=[("Total_Solved", "descending")])
+        )
 
         csv_file = f"{contest_name}_standings.csv"
-        df.to_csv(csv_file, index=False, encoding="utf-8-sig")
+        write_table(table, csv_file)
+
+        df = table.to_pandas()
 
         logger.info(f"\n✅ Scraped {len(df)} participants")
         logger.info(f"✅ Saved to: {csv_file}\n")
@@ -209,13 +257,49 @@ class CodeforcesScraper:
         logger.info("=" * 60)
 
         results = {}
-        scraper = CodeforcesScraper()
+        max_workers = min(len(config.CONTESTS), os.cpu_count() or 1)
 
-        for contest_config in config.CONTESTS:
-            contest_name = contest_config[0]
-            contest_url = contest_config[1]
+        # Patch chromedriver here so the workers don't race on the same file
+        prepare_chromedriver()
+
+        # Contests are independent, so each one gets its own process and browser
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_scrape_one, contest_config[0], contest_config[1])
+                for contest_config in config.CONTESTS
+            ]
 
-            df, csv_file = scraper.scrape_contest(contest_name, contest_url)
-            results[contest_name] = (df, csv_file)
+            for future in futures:
+                contest_name, df, csv_file = future.result()
+                results[contest_name] = (df, csv_file)
 
         return results
+
+
+def _decode_mask(mask: int) -> str:
+    """
+    Convert a solved-problems bitmask to comma-separated problem letters
+
+    Args:
+        mask: Bitmask where bit i means problem chr(65 + i) was solved
+
+    Returns:
+        Problem letters, e.g. "A,C,D"
+    """
+    return ",".join(chr(65 + i) for i in range(mask.bit_length()) if mask >> i & 1)
+
+
+def _scrape_one(contest_name: str, contest_url: str) -> Tuple[str, pd.DataFrame, str]:
+    """
+    Scrape a single contest in a worker process
+
+    Args:
+        contest_name: Name of the contest
+        contest_url: Contest standings URL
+
+    Returns:
+        Tuple of (contest name, DataFrame with results, CSV filename)
+    """
+    scraper = CodeforcesScraper()
+    df, csv_file = scraper.scrape_contest(contest_name, contest_url)
+    return contest_name, df, csv_file
@@ -11,18 +11,54 @@ from utils.logger import logger
 import config
 
 
+def prepare_chromedriver() -> None:
+    """
+    Download and patch chromedriver once before any worker process starts
+    Drivers created with user_multi_procs=True expect this binary to exist already
+    """
+    uc.Patcher().auto()
+
+
 class DriverManager:
 
     def __init__(self):
         self.driver: Optional[uc.Chrome] = None
 
     def init_driver(self) -> uc.Chrome:
-        
+        """
+        Launch a headless Chrome that skips images, fonts and stylesheets
+        Only the rendered standings table is needed, so the rest is wasted bandwidth
+
+        Returns:
+            Chrome driver instance
+        """
         options = uc.ChromeOptions()
-        options.add_argument("--start-maximized")
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-blink-features=AutomationControlled")
-
-        self.driver = uc.Chrome(options=options, version_main=None, use_subprocess=True)
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+            },
+        )
+
+        # Reuse the binary patched by prepare_chromedriver() instead of every
+        # process re-downloading and patching the same file at once
+        self.driver = uc.Chrome(
+            options=options,
+            version_main=None,
+            use_subprocess=True,
+            user_multi_procs=True,
+        )
+
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": config.BLOCKED_URL_PATTERNS}
+        )
 
         return self.driver
 
@@ -35,8 +71,6 @@ class DriverManager:
             raise RuntimeError("Driver not initialized")
 
         try:
-            time.sleep(random.uniform(config.MIN_CLICK_DELAY, config.MAX_CLICK_DELAY))
-
             self.driver.execute_script("window.scrollTo(0, 200);")
             time.sleep(0.2)
             self.driver.execute_script("window.scrollTo(0, 0);")
@@ -64,14 +98,33 @@ class DriverManager:
             logger.error(f"Failed to click checkbox: {e}")
             raise
 
-    def wait_for_cloudflare(self) -> None:
-        """Wait if Cloudflare challenge is detected"""
+    def _page_title(self) -> str:
+        """
+        Get the current page title without transferring the whole page source
+
+        Returns:
+            Lowercased document title
+        """
+        return (self.driver.execute_script("return document.title") or "").lower()
+
+    def wait_for_cloudflare(self) -> bool:
+        """
+        Wait if Cloudflare challenge is detected
+
+        Returns:
+            True if a challenge was detected, False otherwise
+        """
         if not self.driver:
-            return
+            return False
 
-        if "cloudflare" in self.driver.page_source.lower():
+        if "just a moment" in self._page_title() or self.driver.find_elements(
+            By.ID, "cf-wrapper"
+        ):
             logger.warning("⚠️  Cloudflare detected, waiting...")
             time.sleep(config.CLOUDFLARE_WAIT)
+            return True
+
+        return False
 
     def check_access_denied(self) -> bool:
         """
@@ -83,7 +136,9 @@ class DriverManager:
         if not self.driver:
             return False
 
-        return "access denied" in self.driver.page_source.lower()
+        return "access denied" in self._page_title() or bool(
+            self.driver.find_elements(By.CSS_SELECTOR, ".cf-error-code")
+        )
 
     def quit(self) -> None:
         """Close the driver safely"""
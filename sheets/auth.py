@@ -4,11 +4,33 @@ from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
+import orjson
 
 from utils.logger import logger
 import config
 
 
+class OrjsonModel(JsonModel):
+    """JSON request/response model that uses orjson for the large batchUpdate bodies"""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value:
+            if self._data_wrapper:
+                body_value = {"data": body_value}
+        return orjson.dumps(body_value).decode("utf-8")
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
 class SheetsAuthenticator:
 
     def __init__(self):
@@ -37,7 +59,9 @@ class SheetsAuthenticator:
 
             logger.info("✅ Authentication successful")
 
-        self.service = build("sheets", "v4", credentials=self.creds)
+        self.service = build(
+            "sheets", "v4", credentials=self.creds, model=OrjsonModel()
+        )
         return self.service
 
     def get_service(self):
@@ -1,4 +1,5 @@
-import time
+import json
+import os
 import pandas as pd
 from typing import List, Dict, Tuple, Optional
 
@@ -6,6 +7,17 @@ from sheets.auth import SheetsAuthenticator
 from utils.logger import logger
 import config
 
+# Left-aligned cell with a thin black border, shared by every format request
+_CELL_FORMAT = {
+    "userEnteredFormat": {
+        "horizontalAlignment": "LEFT",
+        "borders": {
+            side: {"style": "SOLID", "color": {"red": 0, "green": 0, "blue": 0}}
+            for side in ("left", "right", "top", "bottom")
+        },
+    }
+}
+
 
 class SheetsOperations:
 
@@ -16,7 +28,53 @@ class SheetsOperations:
 
     def initialize(self):
         self.service = self.auth.authenticate()
-        self.sheet_ids = self._get_sheet_ids()
+
+        cached_ids = self._load_cached_sheet_ids()
+        if all(name in cached_ids for name in config.SHEET_NAMES):
+            self.sheet_ids = cached_ids
+        else:
+            self.sheet_ids = self._get_sheet_ids()
+            self._save_cached_sheet_ids(self.sheet_ids)
+
+    def _load_cached_sheet_ids(self) -> Dict[str, int]:
+        """
+        Load sheet IDs cached by a previous run for this spreadsheet
+
+        Returns:
+            Dictionary mapping sheet name to sheet ID, empty if not cached
+        """
+        if not os.path.exists(config.SHEET_IDS_FILE):
+            return {}
+
+        try:
+            with open(config.SHEET_IDS_FILE, "r", encoding="utf-8") as f:
+                return json.load(f).get(config.SPREADSHEET_ID, {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️  Ignoring unreadable {config.SHEET_IDS_FILE}: {e}")
+            return {}
+
+    def _save_cached_sheet_ids(self, sheet_ids: Dict[str, int]) -> None:
+        """
+        Cache sheet IDs so later runs can skip the metadata request
+
+        Args:
+            sheet_ids: Dictionary mapping sheet name to sheet ID
+        """
+        cache = {}
+        if os.path.exists(config.SHEET_IDS_FILE):
+            try:
+                with open(config.SHEET_IDS_FILE, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+
+        cache[config.SPREADSHEET_ID] = sheet_ids
+
+        try:
+            with open(config.SHEET_IDS_FILE, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            logger.warning(f"⚠️  Could not write {config.SHEET_IDS_FILE}: {e}")
 
     def _get_sheet_ids(self) -> Dict[str, int]:
         """
@@ -39,173 +97,176 @@ class SheetsOperations:
 
         return sheet_ids
 
-    def get_sheet_data(self, sheet_name: str) -> List[List[str]]:
+    def get_all_sheet_data(self, sheet_names: List[str]) -> Dict[str, List[List[str]]]:
         """
-        Get all data from a sheet
+        Get all data from several sheets in a single request
 
         Args:
-            sheet_name: Name of the sheet
+            sheet_names: Names of the sheets
 
         Returns:
-            2D list of cell values
+            Dictionary mapping sheet name to 2D list of cell values
         """
         result = (
             self.service.spreadsheets()
             .values()
-            .get(spreadsheetId=config.SPREADSHEET_ID, range=f"{sheet_name}!A:D")
+            .batchGet(
+                spreadsheetId=config.SPREADSHEET_ID,
+                ranges=[f"{sheet_name}!A:D" for sheet_name in sheet_names],
+            )
             .execute()
         )
-        return result.get("values", [])
+        return {
+            sheet_name: value_range.get("values", [])
+            for sheet_name, value_range in zip(
+                sheet_names, result.get("valueRanges", [])
+            )
+        }
 
-    def delete_rows(self, sheet_name: str, rows_to_delete: List[int]) -> None:
+    def build_delete_requests(
+        self, sheet_name: str, rows_to_delete: List[int]
+    ) -> List[Dict]:
         """
-        Delete specified rows from sheet
+        Build requests that delete specified rows from sheet
 
         Args:
             sheet_name: Name of the sheet
             rows_to_delete: List of 0-indexed row numbers to delete
+
+        Returns:
+            List of batchUpdate request dicts
         """
         if not rows_to_delete:
-            return
+            return []
 
         sheet_id = self.sheet_ids.get(sheet_name)
         if sheet_id is None:
             logger.error(f"Sheet '{sheet_name}' not found")
-            return
+            return []
 
         rows_to_delete = sorted(set(rows_to_delete), reverse=True)
 
-        requests = []
+        # Collapse consecutive rows into (low, high) ranges, highest first
+        ranges = []
         for row_index in rows_to_delete:
+            if ranges and ranges[-1][0] - 1 == row_index:
+                ranges[-1] = (row_index, ranges[-1][1])
+            else:
+                ranges.append((row_index, row_index))
+
+        requests = []
+        for low, high in ranges:
             requests.append(
                 {
                     "deleteDimension": {
                         "range": {
                             "sheetId": sheet_id,
                             "dimension": "ROWS",
-                            "startIndex": row_index,
-                            "endIndex": row_index + 1,
+                            "startIndex": low,
+                            "endIndex": high + 1,
                         }
                     }
                 }
             )
 
-        body = {"requests": requests}
-        self.service.spreadsheets().batchUpdate(
-            spreadsheetId=config.SPREADSHEET_ID, body=body
-        ).execute()
-
-        # Only log from the caller with sheet name context
-        time.sleep(2)
+        return requests
 
-    def format_columns(self, sheet_name: str) -> None:
+    def build_format_requests(
+        self, sheet_name: str, values: List[List[str]]
+    ) -> List[Dict]:
         """
-        Format columns B and C with borders and left alignment
+        Build requests that format columns B and C with borders and left alignment
 
         Args:
             sheet_name: Name of the sheet
+            values: 2D list of the column B and C values, one list per sheet row
+
+        Returns:
+            List of batchUpdate request dicts
         """
         sheet_id = self.sheet_ids.get(sheet_name)
         if sheet_id is None:
             logger.error(f"Sheet '{sheet_name}' not found")
-            return
-
-        result = (
-            self.service.spreadsheets()
-            .values()
-            .get(spreadsheetId=config.SPREADSHEET_ID, range=f"{sheet_name}!B:C")
-            .execute()
-        )
-        values = result.get("values", [])
+            return []
 
         if not values:
-            return
+            return []
 
         requests = []
+        formatted_cells = 0
 
-        for row_idx, row in enumerate(values):
-            for col_idx in range(min(2, len(row))):
-                cell_value = row[col_idx].strip() if col_idx < len(row) else ""
-
-                if not cell_value:
-                    continue
-
+        # One repeatCell per contiguous run of non-empty cells in each column
+        for col_idx in range(2):
+            for start, end in _non_empty_runs(values, col_idx):
                 requests.append(
                     {
-                        "updateCells": {
+                        "repeatCell": {
                             "range": {
                                 "sheetId": sheet_id,
-                                "startRowIndex": row_idx,
-                                "endRowIndex": row_idx + 1,
+                                "startRowIndex": start,
+                                "endRowIndex": end,
                                 "startColumnIndex": col_idx + 1,
                                 "endColumnIndex": col_idx + 2,
                             },
+                            "cell": _CELL_FORMAT,
                             "fields": "userEnteredFormat(horizontalAlignment,borders)",
-                            "rows": [
-                                {
-                                    "values": [
-                                        {
-                                            "userEnteredFormat": {
-                                                "horizontalAlignment": "LEFT",
-                                                "borders": {
-                                                    "left": {
-                                                        "style": "SOLID",
-                                                        "color": {
-                                                            "red": 0,
-                                                            "green": 0,
-                                                            "blue": 0,
-                                                        },
-                                                    },
-                                                    "right": {
-                                                        "style": "SOLID",
-                                                        "color": {
-                                                            "red": 0,
-                                                            "green": 0,
-                                                            "blue": 0,
-                                                        },
-                                                    },
-                                                    "top": {
-                                                        "style": "SOLID",
-                                                        "color": {
-                                                            "red": 0,
-                                                            "green": 0,
-                                                            "blue": 0,
-                                                        },
-                                                    },
-                                                    "bottom": {
-                                                        "style": "SOLID",
-                                                        "color": {
-                                                            "red": 0,
-                                                            "green": 0,
-                                                            "blue": 0,
-                                                        },
-                                                    },
-                                                },
-                                            }
-                                        }
-                                    ]
-                                }
-                            ],
                         }
                     }
                 )
+                formatted_cells += end - start
 
         if requests:
-            for i in range(0, len(requests), 50):
-                batch = requests[i : i + 50]
-                body = {"requests": batch}
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=config.SPREADSHEET_ID, body=body
-                ).execute()
-                time.sleep(1)
+            logger.info(f"  ✅ Queued formatting for {formatted_cells} cells")
+
+        return requests
+
+    def apply_requests(self, requests: List[Dict]) -> None:
+        """
+        Execute batchUpdate requests in as few API calls as possible
+
+        Args:
+            requests: List of batchUpdate request dicts, applied in order
+        """
+        for i in range(0, len(requests), config.MAX_BATCH_REQUESTS):
+            batch = requests[i : i + config.MAX_BATCH_REQUESTS]
+            body = {"requests": batch}
+            self.service.spreadsheets().batchUpdate(
+                spreadsheetId=config.SPREADSHEET_ID, body=body
+            ).execute()
+
+
+def _non_empty_runs(values: List[List[str]], col_idx: int) -> List[Tuple[int, int]]:
+    """
+    Find contiguous runs of non-empty cells in a column
 
-            logger.info(f"  ✅ Formatted {len(requests)} cells")
+    Args:
+        values: 2D list of cell values
+        col_idx: Column index within each row
+
+    Returns:
+        List of (start, end) row ranges, end exclusive
+    """
+    runs = []
+    start = None
+
+    for row_idx, row in enumerate(values):
+        filled = col_idx < len(row) and bool(row[col_idx].strip())
+
+        if filled and start is None:
+            start = row_idx
+        elif not filled and start is not None:
+            runs.append((start, row_idx))
+            start = None
+
+    if start is not None:
+        runs.append((start, len(values)))
+
+    return runs
 
 
 def should_delete_row(
     handle: str,
-    contest_configs: List[Tuple[str, str, Optional[int]]],
-    dfs: Dict[str, pd.DataFrame],
+    contest_info: List[Tuple[str, Dict[str, int], Optional[int]]],
     global_threshold: int,
 ) -> Tuple[bool, Dict]:
     """
@@ -213,8 +274,7 @@ def should_delete_row(
 
     Args:
         handle: Participant handle
-        contest_configs: List of contest configurations
-        dfs: Dictionary mapping contest name to DataFrame
+        contest_info: List of (contest name, {handle: total_solved}, threshold)
         global_threshold: Minimum total problems across all contests
 
     Returns:
@@ -228,16 +288,8 @@ def should_delete_row(
     total_across_contests = 0
     failed_thresholds = []
 
-    for contest_config in contest_configs:
-        contest_name = contest_config[0]
-        contest_threshold = contest_config[2] if len(contest_config) > 2 else None
-
-        df = dfs[contest_name]
-
-        if handle in df["Handle"].values:
-            total_solved = df[df["Handle"] == handle].iloc[0]["Total_Solved"]
-        else:
-            total_solved = 0
+    for contest_name, totals, contest_threshold in contest_info:
+        total_solved = totals.get(handle, 0)
 
         total_across_contests += total_solved
 
@@ -283,7 +335,23 @@ def clean_google_sheets(dfs: Dict[str, pd.DataFrame]) -> None:
 
     logger.info("✅ Authenticated\n")
 
+    # Index each contest by handle once so row checks are O(1) lookups.
+    # Duplicate handles keep their first row, like the old .iloc[0] lookup.
+    contest_info = []
+    for contest_name, _, threshold in config.CONTESTS:
+        df = dfs[contest_name].drop_duplicates("Handle")
+        totals = dict(
+            zip(
+                df["Handle"].to_numpy(),
+                df["Total_Solved"].to_numpy().astype(int).tolist(),
+            )
+        )
+        contest_info.append((contest_name, totals, threshold))
+
     total_deleted = 0
+    all_data = sheets.get_all_sheet_data(config.SHEET_NAMES)
+    remaining_by_sheet = {}
+    all_requests = []
 
     # Process each sheet
     for sheet_name in config.SHEET_NAMES:
@@ -291,7 +359,8 @@ def clean_google_sheets(dfs: Dict[str, pd.DataFrame]) -> None:
         logger.info(f"Processing Sheet: '{sheet_name}'")
         logger.info("=" * 60)
 
-        data = sheets.get_sheet_data(sheet_name)
+        data = all_data[sheet_name]
+        remaining_by_sheet[sheet_name] = data
 
         if not data or len(data) < 4:
             logger.warning("  ⚠️  No data rows")
@@ -309,27 +378,36 @@ def clean_google_sheets(dfs: Dict[str, pd.DataFrame]) -> None:
                 continue
 
             should_delete, details = should_delete_row(
-                handle, config.CONTESTS, dfs, config.GLOBAL_THRESHOLD
+                handle, contest_info, config.GLOBAL_THRESHOLD
             )
 
             if should_delete:
                 rows_to_delete.append(row_idx)
 
         if rows_to_delete:
-            sheets.delete_rows(sheet_name, rows_to_delete)
+            all_requests += sheets.build_delete_requests(sheet_name, rows_to_delete)
             total_deleted += len(rows_to_delete)
-            logger.info(f"  ✅ Deleted {len(rows_to_delete)} rows from '{sheet_name}'")
+            logger.info(f"  ✅ Marked {len(rows_to_delete)} rows in '{sheet_name}'")
+
+            # Formatting runs after the deletions in the same batch, so it must
+            # target the row positions the sheet will have once they are applied
+            deleted = set(rows_to_delete)
+            remaining_by_sheet[sheet_name] = [
+                row for row_idx, row in enumerate(data) if row_idx not in deleted
+            ]
         else:
             logger.info(f"  ✅ No rows to delete in '{sheet_name}'")
 
-    logger.info(f"\n✅ Total deleted: {total_deleted} rows\n")
-
-    logger.info("=" * 60)
+    logger.info("\n" + "=" * 60)
     logger.info("STEP 3: FORMATTING COLUMNS")
     logger.info("=" * 60)
 
     for sheet_name in config.SHEET_NAMES:
         logger.info(f"\n📋 Formatting '{sheet_name}'...")
-        sheets.format_columns(sheet_name)
+        columns_b_c = [row[1:3] for row in remaining_by_sheet[sheet_name]]
+        all_requests += sheets.build_format_requests(sheet_name, columns_b_c)
+
+    sheets.apply_requests(all_requests)
 
+    logger.info(f"\n✅ Total deleted: {total_deleted} rows")
     logger.info("✅ Formatting complete!")
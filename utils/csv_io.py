@@ -0,0 +1,51 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from typing import Dict
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+STANDINGS_DTYPES: Dict[str, str] = {
+    "Handle": "string",
+    "Solved_Problems": "string",
+    "Total_Solved": "int32",
+}
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """
+    Write a DataFrame to CSV with pyarrow's writer
+
+    Args:
+        df: DataFrame to write
+        path: Output CSV file path
+    """
+    write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+
+
+def write_table(table: pa.Table, path: str) -> None:
+    """
+    Write an Arrow table to CSV with pyarrow's writer
+
+    Args:
+        table: Arrow table to write
+        path: Output CSV file path
+    """
+    # Keep the BOM pandas wrote with utf-8-sig so Excel still detects UTF-8
+    with open(path, "wb") as f:
+        f.write(UTF8_BOM)
+        pa_csv.write_csv(table, f)
+
+
+def read_csv(path: str, dtype: Dict[str, str]) -> pd.DataFrame:
+    """
+    Read a CSV with explicit column types using pyarrow's parser
+
+    Args:
+        path: Input CSV file path
+        dtype: Dictionary mapping column name to dtype
+
+    Returns:
+        Loaded DataFrame
+    """
+    return pd.read_csv(path, engine="pyarrow", dtype=dtype)
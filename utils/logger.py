@@ -1,42 +1,708 @@
+import atexit
 import logging
+import logging.handlers
+import multiprocessing.util
+import os
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from collections.abc import Mapping
+from typing import List, Optional
 
+# Most iovecs a single os.writev call accepts
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
 
-def setup_logger(name: str = "ACMTracker", level: int = logging.INFO) -> logging.Logger:
+
+class SlimLogRecord(logging.LogRecord):
+    """
+    LogRecord that only fills in what our handlers and formatters use
+
+    Source location, thread and process fields are set to cheap placeholders
+    instead of being looked up. Records keep a regular __dict__ so `extra=`
+    and third-party code reading record attributes keep working.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        pathname: str,
+        lineno: int,
+        msg,
+        args,
+        exc_info,
+        func: Optional[str] = None,
+        sinfo: Optional[str] = None,
+        **kwargs,
+    ):
+        created = time.time()
+        if args and len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]
+
+        self.name = name
+        self.msg = msg
+        self.args = args
+        self.levelname = logging.getLevelName(level)
+        self.levelno = level
+        self.pathname = self.filename = self.module = pathname
+        self.lineno = lineno
+        self.funcName = func
+        self.exc_info = exc_info
+        self.exc_text = None
+        self.stack_info = sinfo
+        self.created = created
+        self.msecs = int((created - int(created)) * 1000) + 0.0
+        self.relativeCreated = (created - logging._startTime) * 1000
+        self.thread = self.threadName = None
+        self.process = self.processName = None
+        self.taskName = None
+
+    def getMessage(self) -> str:
+        if not self.args and type(self.msg) is str:
+            return self.msg
+        return super().getMessage()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that formats the timestamp once per second instead of per record
+
+    Requires a datefmt with whole-second resolution (no milliseconds).
+    """
+
+    __slots__ = ("_cached_time",)
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+        super().__init__(fmt, datefmt)
+        # (second, formatted) swapped as one tuple so shared use stays consistent
+        self._cached_time = (-1, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        sec = int(record.created)
+        cached_sec, asctime = self._cached_time
+        if sec != cached_sec:
+            asctime = time.strftime(self.datefmt, time.localtime(sec))
+            self._cached_time = (sec, asctime)
+        return asctime
+
+
+class FastFormatter(CachedTimeFormatter):
+    """
+    Formatter for "asctime - name - levelname - message" lines
+
+    Builds the line with an f-string instead of %-style interpolation.
+    """
+
+    __slots__ = ()
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = (
+            f"{self.formatTime(record)} - {record.name} - {record.levelname} - "
+            f"{record.getMessage()}"
+        )
+
+        return self._append_exception(line, record)
+
+    def _append_exception(self, line: str, record: logging.LogRecord) -> str:
+        if record.exc_info or record.exc_text or record.stack_info:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            if record.exc_text:
+                line = f"{line}\n{record.exc_text}"
+            if record.stack_info:
+                line = f"{line}\n{self.formatStack(record.stack_info)}"
+
+        return line
+
+
+class CompactFormatter(FastFormatter):
+    """
+    Formatter for "ms - name - levelname - message" lines
+
+    Replaces the timestamp with milliseconds since the formatter was created
+    and writes a "# wallclock <UTC time> @ <ms>" marker line at most once per
+    second, so absolute times can be recovered from the nearest marker.
+    """
+
+    __slots__ = ("_epoch", "_marked_sec")
+
+    def __init__(self):
+        super().__init__()
+        self._epoch = time.time()
+        self._marked_sec = -1
+
+    def format(self, record: logging.LogRecord) -> str:
+        tick = int((record.created - self._epoch) * 1000)
+        line = f"{tick} - {record.name} - {record.levelname} - {record.getMessage()}"
+
+        sec = int(record.created)
+        if sec != self._marked_sec:
+            self._marked_sec = sec
+            wallclock = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+            marker_tick = int((sec - self._epoch) * 1000)
+            line = f"# wallclock {wallclock} @ {marker_tick}\n{line}"
+
+        return self._append_exception(line, record)
+
+
+class FastConsoleHandler(logging.Handler):
+    """
+    Console handler that writes just the message to stdout's binary buffer
+
+    Skips the Formatter, the per-record handler lock and the per-record flush of
+    StreamHandler. Output is flushed right away when stdout is a terminal or
+    for WARNING and above; otherwise it is left to stdout's own buffering.
+    """
+
+    __slots__ = ()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            stream = sys.stdout
+            line = record.getMessage() + "\n"
+            if record.exc_info or record.exc_text or record.stack_info:
+                line = _CONSOLE_FORMAT.format(record) + "\n"
+            buffer = getattr(stream, "buffer", None)
+
+            if buffer is None:
+                stream.write(line)
+            else:
+                buffer.write(
+                    line.encode(stream.encoding or "utf-8", stream.errors or "strict")
+                )
+
+            line_buffered = getattr(stream, "line_buffering", True)
+            if line_buffered or record.levelno >= logging.WARNING:
+                stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class RawAppendHandler(logging.Handler):
+    """
+    Append-only file handler that writes encoded bytes straight to a file descriptor
+
+    Skips the TextIOWrapper/BufferedWriter layers of a regular FileHandler.
+    The file is opened with O_APPEND, so each write lands at the end of the
+    file even when several processes share it. Like RotatingFileHandler, the
+    file can be rolled over to name.1 ... name.N once it reaches max_bytes, and
+    opening it can be delayed until the first write.
+    """
+
+    __slots__ = (
+        "baseFilename",
+        "encoding",
+        "max_bytes",
+        "backup_count",
+        "_fd",
+        "_size",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        filename: str,
+        encoding: str = "utf-8",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        delay: bool = False,
+    ):
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._fd: Optional[int] = None
+        self._size = 0
+        self._closed = False
+
+        if not delay:
+            self._open()
+
+    def _open(self) -> None:
+        self._fd = os.open(
+            self.baseFilename,
+            os.O_WRONLY
+            | os.O_APPEND
+            | os.O_CREAT
+            | getattr(os, "O_CLOEXEC", 0)
+            | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._size = os.fstat(self._fd).st_size
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.emit_chunks([self._encode(record)], self.shouldFlush(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Format a batch of records and write them out together
+
+        Args:
+            records: Records that already passed the handler's level check
+        """
+        chunks = []
+        urgent = False
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                chunks.append(self._encode(record))
+            except RecursionError:
+                raise
+            except Exception:
+                self.handleError(record)
+                continue
+            urgent = urgent or self.shouldFlush(record)
+
+        if not chunks:
+            return
+
+        self.acquire()
+        try:
+            self.emit_chunks(chunks, urgent)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+    def emit_chunks(self, chunks: List[bytes], urgent: bool) -> None:
+        """Write encoded lines straight to the file"""
+        self._write_chunks(chunks)
+
+    def _encode(self, record: logging.LogRecord) -> bytes:
+        return (self.format(record) + "\n").encode(self.encoding)
+
+    def _write_chunks(self, chunks: List[bytes]) -> None:
+        if self._fd is None:
+            self._open()
+
+        size = sum(len(chunk) for chunk in chunks)
+        if self._should_rollover(size):
+            self._rollover()
+
+        if len(chunks) == 1 or not hasattr(os, "writev"):
+            self._write_all(b"".join(chunks))
+        else:
+            # One scatter-gather syscall per IOV_MAX lines instead of one per line
+            for i in range(0, len(chunks), _IOV_MAX):
+                batch = chunks[i : i + _IOV_MAX]
+                try:
+                    written = os.writev(self._fd, batch)
+                except (BlockingIOError, InterruptedError):
+                    written = 0
+                if written < sum(len(chunk) for chunk in batch):
+                    self._write_all(b"".join(batch)[written:])
+
+        self._size += size
+
+    def _write_all(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except (BlockingIOError, InterruptedError):
+                continue
+            view = view[written:]
+
+    def _should_rollover(self, incoming: int) -> bool:
+        return (
+            self.max_bytes > 0
+            and self.backup_count > 0
+            and self._size > 0
+            and self._size + incoming > self.max_bytes
+        )
+
+    def _rollover(self) -> None:
+        os.close(self._fd)
+        self._fd = None
+
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.baseFilename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.baseFilename}.{i + 1}")
+
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, f"{self.baseFilename}.1")
+
+        self._open()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self._closed = True
+        finally:
+            self.release()
+        super().close()
+
+
+class BufferedFileHandler(RawAppendHandler):
+    """
+    File handler that batches writes in a large buffer
+
+    Records are flushed to disk when a WARNING or higher is logged, when the
+    buffer fills up, when flush() is called (BatchingQueueListener does so
+    periodically), and on shutdown, instead of after every record.
+    """
+
+    __slots__ = ("buffer_size", "_buffer", "_buffered_bytes")
+
+    def __init__(
+        self,
+        filename: str,
+        encoding: str = "utf-8",
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        delay: bool = False,
+        buffer_size: int = 64 * 1024,
+    ):
+        super().__init__(
+            filename,
+            encoding=encoding,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            delay=delay,
+        )
+        self.buffer_size = buffer_size
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+
+        # Empty the buffer before forking so children don't write it out again
+        os.register_at_fork(before=self._flush_for_fork, after_in_parent=self.release)
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING
+
+    def emit_chunks(self, chunks: List[bytes], urgent: bool) -> None:
+        """Buffer encoded lines, writing them out when urgent or the buffer is full"""
+        self._buffer.extend(chunks)
+        self._buffered_bytes += sum(len(chunk) for chunk in chunks)
+        if urgent or self._buffered_bytes >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._buffer and not self._closed:
+                chunks = self._buffer
+                self._buffer = []
+                self._buffered_bytes = 0
+                self._write_chunks(chunks)
+        finally:
+            self.release()
+
+    def _flush_for_fork(self) -> None:
+        self.acquire()
+        self.flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that drains up to batch_size queued records at a time
+
+    Handlers that implement handle_batch get the whole batch at once, which lets
+    the file handler write it with a single os.writev call. The same thread
+    flushes every handler each flush_interval seconds, so buffered handlers
+    need no timer thread of their own.
+    """
+
+    __slots__ = ("batch_size", "flush_interval")
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        batch_size: int = 64,
+        flush_interval: float = 30.0,
+    ):
+        # A zero timeout would turn the blocking get into a busy poll
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive, got {flush_interval}")
+
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        stopping = False
+        next_flush = time.monotonic() + self.flush_interval
+
+        while not stopping:
+            try:
+                items = [q.get(timeout=max(0.0, next_flush - time.monotonic()))]
+            except queue.Empty:
+                items = []
+
+            while items and len(items) < self.batch_size:
+                try:
+                    items.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = []
+            for item in items:
+                if item is self._sentinel:
+                    stopping = True
+                else:
+                    records.append(self.prepare(item))
+
+            if records:
+                self.handle_batch(records)
+
+            if has_task_done:
+                for _ in items:
+                    q.task_done()
+
+            if time.monotonic() >= next_flush:
+                for handler in self.handlers:
+                    handler.flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Pass a batch of records to every handler
+
+        Args:
+            records: Records taken off the queue
+        """
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                accepted = [r for r in records if r.levelno >= handler.level]
+            else:
+                accepted = records
+
+            if hasattr(handler, "handle_batch"):
+                handler.handle_batch(accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
+
+
+# Formatter shared by every file handler setup_logger creates
+_FILE_FORMAT = FastFormatter()
+
+# Only used by the console handler for records carrying a traceback
+_CONSOLE_FORMAT = logging.Formatter("%(message)s")
+
+_record_fields_disabled = False
+_setup_lock = threading.Lock()
+
+
+def _disable_unused_record_fields() -> None:
+    """
+    Stop logging from collecting LogRecord fields our formatters never use
+
+    Skips the thread/process lookups and the caller stack walk done for every
+    record, and builds records with SlimLogRecord. As a result %(threadName)s,
+    %(processName)s, %(filename)s, %(funcName)s and %(lineno)d are not
+    available to formatters.
+    """
+    global _record_fields_disabled
+    if _record_fields_disabled:
+        return
+
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    logging.setLogRecordFactory(SlimLogRecord)
+    _record_fields_disabled = True
+
+
+def setup_logger(
+    name: str = "ACMTracker",
+    level: int = logging.INFO,
+    flush_interval: float = 30.0,
+    compact: bool = False,
+) -> logging.Logger:
     """
     Setup and configure logger with both file and console handlers
 
     Args:
         name: Logger name
         level: Logging level
+        flush_interval: Seconds between periodic flushes of the log file,
+            must be positive
+        compact: Write relative millisecond ticks plus periodic wall-clock
+            markers to the log file instead of a full timestamp per line
 
     Returns:
         Configured logger instance
     """
+    _disable_unused_record_fields()
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     if logger.handlers:
         return logger
 
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Re-check under the lock so concurrent callers can't both install handlers
+    with _setup_lock:
+        if not logger.handlers:
+            _install_handlers(logger, level, flush_interval, compact)
+
+    return logger
+
+
+def _install_handlers(
+    logger: logging.Logger, level: int, flush_interval: float, compact: bool
+) -> None:
+    """
+    Attach the console handler and the queued file handler to a logger
+
+    Args:
+        logger: Logger to configure
+        level: Logging level for console output
+        flush_interval: Seconds between periodic flushes of the log file
+        compact: Use CompactFormatter for the log file
+    """
+    # Records are fully handled here; don't hand them to ancestor loggers too
+    logger.propagate = False
+
+    console_handler = FastConsoleHandler()
     console_handler.setLevel(level)
-    console_format = logging.Formatter("%(message)s")
-    console_handler.setFormatter(console_format)
 
-    file_handler = logging.FileHandler("acm_tracker.log", encoding="utf-8")
+    file_handler = BufferedFileHandler(
+        "acm_tracker.log", max_bytes=16 * 1024 * 1024, backup_count=5, delay=True
+    )
     file_handler.setLevel(logging.DEBUG)
-    file_format = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
+    file_handler.setFormatter(CompactFormatter() if compact else _FILE_FORMAT)
+
+    # File writes happen on a background thread; callers only enqueue records.
+    # That thread already batches lines into one writev per flush, so an
+    # io_uring backend would only save syscalls nobody is waiting on and is
+    # not worth a native dependency.
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = BatchingQueueListener(
+        log_queue,
+        file_handler,
+        respect_handler_level=True,
+        flush_interval=flush_interval,
+    )
+    listener.start()
+    atexit.register(file_handler.close)
+    atexit.register(listener.stop)
+    multiprocessing.util.register_after_fork(
+        listener, lambda listener: _restart_listener(listener, queue_handler)
     )
-    file_handler.setFormatter(file_format)
 
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
+    logger._listener = listener
+
+
+def _restart_listener(
+    listener: logging.handlers.QueueListener,
+    queue_handler: logging.handlers.QueueHandler,
+) -> None:
+    """
+    Restart the file listener inside a forked worker process
+
+    Threads do not survive a fork, so without this records logged by worker
+    processes would sit in the queue forever and buffered file output would
+    never be flushed periodically. Worker processes also skip atexit, so the
+    final flush is registered as a multiprocessing finalizer.
 
+    Args:
+        listener: Listener inherited from the parent process
+        queue_handler: Handler feeding the listener's queue
+    """
+    log_queue = queue.Queue(-1)
+    queue_handler.queue = log_queue
+    listener.queue = log_queue
+    listener._thread = None
+    listener.start()
+    multiprocessing.util.Finalize(
+        listener, lambda: _stop_listener(listener), exitpriority=10
+    )
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Drain the queue and flush everything the listener's handlers buffered"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
+def __getattr__(name: str):
+    """Create the module-level `logger` on first access instead of at import"""
+    if name == "logger":
+        return _get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_logger() -> logging.Logger:
+    """Set up the module-level logger and bind the shortcut fast paths to it"""
+    global logger, _log, _isEnabledFor
+    logger = setup_logger()
+    _log = logger._log
+    _isEnabledFor = logger.isEnabledFor
     return logger
 
 
-logger = setup_logger()
+# Level-checked shortcuts for hot call sites, e.g. `from utils.logger import debug`.
+# They skip the Logger method lookups and go straight to the cached level check.
+# Until the logger exists these placeholders create it and are then rebound.
+def _log(level: int, msg: str, args: tuple) -> None:
+    _get_logger()._log(level, msg, args)
+
+
+def _isEnabledFor(level: int) -> bool:
+    return _get_logger().isEnabledFor(level)
+
+
+def debug(msg: str, *args) -> None:
+    if _isEnabledFor(logging.DEBUG):
+        _log(logging.DEBUG, msg, args)
+
+
+def info(msg: str, *args) -> None:
+    if _isEnabledFor(logging.INFO):
+        _log(logging.INFO, msg, args)
+
+
+def warning(msg: str, *args) -> None:
+    if _isEnabledFor(logging.WARNING):
+        _log(logging.WARNING, msg, args)
+
+
+def error(msg: str, *args) -> None:
+    if _isEnabledFor(logging.ERROR):
+        _log(logging.ERROR, msg, args)